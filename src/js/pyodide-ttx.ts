@@ -81,6 +81,14 @@ export class PyodideTTX {
       from typing import List, Dict, Any, Optional, Union
       import xml.etree.ElementTree as ET
 
+      # Import the commonly used table modules now, while loading, instead of
+      # on the first conversion request
+      from fontTools.misc import xmlWriter
+      from fontTools.ttLib.tables import (
+          _g_l_y_f, _h_e_a_d, _n_a_m_e, _c_m_a_p, _h_m_t_x, _m_a_x_p, _p_o_s_t,
+          G_S_U_B_, G_P_O_S_,
+      )
+
       class PyodideTTXProcessor:
           """
           Python FontTools TTX processor running in Pyodide